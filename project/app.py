@@ -1,15 +1,57 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from quart import (
+    Quart,
+    Response,
+    request,
+    jsonify,
+    redirect,
+    render_template,
+    send_from_directory,
+)
 from io import BytesIO
 from PIL import Image
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
 import base64
+import hashlib
+import multiprocessing
 import os
+import queue
+import re
+import secrets
+import threading
 import time
+import aiofiles
+import numpy as np
 import torch
 
 from transformers import BlipProcessor, BlipForConditionalGeneration
+from transformers.models.blip import modeling_blip
 from peft import PeftModel
 from gtts import gTTS
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+# libjpeg-turbo(SIMD) 디코더 / OpenCV 리사이즈 (없으면 PIL로 처리)
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+
+    jpeg_decoder = TurboJPEG()
+except Exception:
+    jpeg_decoder = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# 로컬 STT (CTranslate2 Whisper). 없으면 OpenAI Whisper 사용
+try:
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+from llm_cache import LLMCache, MemoryBackend, RedisBackend, SemanticIndex, cache_key
 
 # -----------------------------
 #  경로 / 환경 설정
@@ -22,140 +64,915 @@ BASE_MODEL = "Salesforce/blip-image-captioning-base"
 LORA_DIR = os.path.join(BASE_DIR, "blip_lora_ko")
 ADAPTER_DIR = os.path.join(LORA_DIR, "adapter")
 PROCESSOR_DIR = os.path.join(LORA_DIR, "processor")
+# scripts/merge_lora.py 로 미리 merge 해둔 체크포인트 (있으면 PEFT 없이 바로 로드)
+MERGED_DIR = os.path.join(LORA_DIR, "merged")
 
-# 🔊 TTS 파일은 static/tts 밑에 저장
+# 🔊 TTS 파일은 static/tts 밑에 저장 (파일명 = 문장 내용 해시)
 TTS_DIR = os.path.join(BASE_DIR, "static", "tts")
 os.makedirs(TTS_DIR, exist_ok=True)
 
 DEVICE = torch.device("cpu")
 
+# CPU 추론 스레드 설정: 연산 내부 병렬은 코어 수만큼, 연산 간 병렬은 1
+torch.set_num_threads(os.cpu_count())
+torch.set_num_interop_threads(1)
+torch.backends.mkldnn.enabled = True
+
+# vision encoder attention을 scaled_dot_product_attention(fused)으로 교체할지
+BLIP_SDPA = os.environ.get("BLIP_SDPA", "1") == "1"
+
+# torch.compile 사용 여부 (첫 컴파일에 1분 이상 걸리므로 끌 수 있게)
+BLIP_COMPILE = os.environ.get("BLIP_COMPILE", "1") == "1"
+
+# BLIP 가중치 정밀도: fp32 (기본) / int8 (동적 양자화) / bf16
+# int8/bf16은 더 빠르지만 캡션 품질이 달라질 수 있으므로
+# 같은 이미지로 fp32 캡션과 비교해 본 뒤에 켤 것
+BLIP_PRECISION = os.environ.get("BLIP_PRECISION", "fp32")
+
+# BLIP generate 옵션 (워밍업과 실제 추론이 같은 설정을 쓰도록 한 곳에 모음)
+# beam 3개 + early_stopping: beam 5개 대비 decoder 연산 ~40% 감소
+# (캡션 품질이 떨어지면 num_beams=4 정도로 올려볼 것)
+BLIP_GENERATE_KWARGS = {
+    "max_new_tokens": 30,
+    "num_beams": 3,
+    "early_stopping": True,
+    "no_repeat_ngram_size": 2,
+    "length_penalty": 1.0,
+    "use_cache": True,
+}
+
+# BLIP 워커 프로세스 수. 1이면 서버 프로세스에서 직접 추론,
+# 2 이상이면 프로세스마다 모델을 따로 로드해서 GIL 없이 코어를 나눠 씀
+BLIP_WORKERS = int(os.environ.get("BLIP_WORKERS", 1))
+
+# 동적 배칭: 최대 몇 장까지, 첫 요청 이후 몇 초까지 모아서 한 번에 generate 할지
+BLIP_MAX_BATCH_SIZE = int(os.environ.get("BLIP_MAX_BATCH_SIZE", 8))
+BLIP_BATCH_TIMEOUT = float(os.environ.get("BLIP_BATCH_TIMEOUT", 0.01))
+
+# 캡션 한 건을 기다리는 최대 시간(초). 워커가 죽거나 멈춰도 요청이 영원히 걸려 있지 않게
+BLIP_TIMEOUT = float(os.environ.get("BLIP_TIMEOUT", 60))
+
+# 같은 이미지(sha256)의 OpenAI 업로드 file_id 캐시 크기
+IMAGE_FILE_CACHE_SIZE = int(os.environ.get("IMAGE_FILE_CACHE_SIZE", 256))
+# 같은 이미지의 /api/caption 결과 (BLIP 캡션 + 한국어 캡션) 캐시 크기
+CAPTION_CACHE_SIZE = int(os.environ.get("CAPTION_CACHE_SIZE", 512))
+
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
-# Flask 앱
-app = Flask(__name__, static_folder="static", static_url_path="/")
+LLM_MODEL = "gpt-4o-mini"
+EMBEDDING_MODEL = "text-embedding-3-small"
+TTS_MODEL = "gpt-4o-mini-tts"
+TTS_VOICE = "alloy"
+
+# LLM 스트림을 TTS로 넘기는 문장 경계
+SENTENCE_END = re.compile(r"[.!?。]+\s+|\n+")
+
+# STT 백엔드: local (faster-whisper, int8) / openai (whisper-1)
+STT_BACKEND = os.environ.get("STT_BACKEND", "local")
+WHISPER_MODEL_SIZE = os.environ.get("WHISPER_MODEL_SIZE", "small")
+
+# LLM 응답 캐시 설정 (REDIS_URL 있으면 Redis, 없으면 메모리)
+REDIS_URL = os.environ.get("REDIS_URL")
+LLM_CACHE_TTL = int(os.environ.get("LLM_CACHE_TTL", 86400))
+LLM_SEMANTIC_CACHE = os.environ.get("LLM_SEMANTIC_CACHE", "1") == "1"
+LLM_SEMANTIC_THRESHOLD = float(os.environ.get("LLM_SEMANTIC_THRESHOLD", 0.92))
+
+VISION_QA_PROMPT = (
+    "너는 시각장애인을 위한 장면 설명 도우미야. "
+    "아래 이미지를 보고, 사용자의 질문에 대해 "
+    "한국어로 1~2문장 정도로 짧고 분명하게 대답해 줘.\n\n"
+    "질문: {question}"
+)
+
+# Quart 앱 (Flask와 같은 API, 라우트는 async)
+app = Quart(__name__, static_folder="static", static_url_path="/")
+
+# OpenAI LLM 클라이언트 (async: 응답 대기 중에도 다른 요청 처리)
+llm_client = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+
 
-# OpenAI LLM 클라이언트
-llm_client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+async def embed_text(text: str) -> list:
+    """semantic 캐시용 임베딩"""
+    result = await llm_client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+    return result.data[0].embedding
+
+
+# LLM 응답 캐시
+llm_cache = LLMCache(
+    backend=RedisBackend(REDIS_URL) if REDIS_URL else MemoryBackend(),
+    ttl=LLM_CACHE_TTL,
+    semantic=SemanticIndex(threshold=LLM_SEMANTIC_THRESHOLD),
+    embed_fn=embed_text if (llm_client and LLM_SEMANTIC_CACHE) else None,
+)
 
 
 # -----------------------------
 #  BLIP + LoRA 로딩
 # -----------------------------
-def load_model():
+def enable_sdpa_attention(model) -> bool:
     """
-    1) BLIP base 모델 로드
-    2) LoRA adapter를 merge
-    3) processor 로드
+    BLIP vision encoder의 BlipAttention.forward를
+    F.scaled_dot_product_attention 기반으로 교체.
+    QK^T 행렬을 따로 만들지 않는 fused attention(CPU는 oneDNN)을 사용.
+    head_mask / output_attentions가 필요한 호출은 원래 구현으로 처리.
+
+    transformers 내부 구현(qkv / projection / scale, (out, weights) 반환)에
+    기대는 패치라서, 속성이 없거나 더미 입력에서 원래 forward와 결과가 다르면
+    패치하지 않고 False 반환.
     """
-    print("🔄 BLIP + LoRA 모델 로딩 중...")
+    attention_cls = modeling_blip.BlipAttention
+    if getattr(attention_cls, "_sdpa_patched", False):
+        return True
+
+    attention = model.vision_model.encoder.layers[0].self_attn
+    if not all(
+        hasattr(attention, name) for name in ("qkv", "projection", "scale", "num_heads")
+    ):
+        print("⚠ BlipAttention 구조가 예상과 다름 → SDPA 패치 건너뜀")
+        return False
+
+    original_forward = attention_cls.forward
+
+    def sdpa_forward(
+        self, hidden_states, head_mask=None, output_attentions=False, **kwargs
+    ):
+        if head_mask is not None or output_attentions:
+            return original_forward(
+                self,
+                hidden_states,
+                head_mask=head_mask,
+                output_attentions=output_attentions,
+                **kwargs,
+            )
+
+        bsz, tgt_len, embed_dim = hidden_states.size()
+        mixed_qkv = (
+            self.qkv(hidden_states)
+            .reshape(bsz, tgt_len, 3, self.num_heads, embed_dim // self.num_heads)
+            .permute(2, 0, 3, 1, 4)
+        )
+        query_states, key_states, value_states = mixed_qkv[0], mixed_qkv[1], mixed_qkv[2]
+
+        context_layer = torch.nn.functional.scaled_dot_product_attention(
+            query_states,
+            key_states,
+            value_states,
+            attn_mask=None,
+            dropout_p=0.0,
+            scale=self.scale,
+        )
+        context_layer = context_layer.permute(0, 2, 1, 3).reshape(bsz, tgt_len, embed_dim)
+        return self.projection(context_layer), None
+
+    # 패치 전후 출력이 같은지 더미 배치로 한 번 확인
+    weight = attention.qkv.weight
+    hidden_states = torch.randn(
+        2, 16, attention.qkv.in_features, dtype=weight.dtype, device=weight.device
+    )
+    atol = 1e-4 if weight.dtype == torch.float32 else 1e-2
+    try:
+        with torch.inference_mode():
+            expected = original_forward(attention, hidden_states)[0]
+            actual = sdpa_forward(attention, hidden_states)[0]
+        matches = torch.allclose(expected, actual, atol=atol, rtol=1e-3)
+    except Exception as e:
+        print("⚠ SDPA attention 확인 실패 → 패치 건너뜀:", e)
+        return False
+    if not matches:
+        print("⚠ SDPA attention 출력이 원래 구현과 다름 → 패치 건너뜀")
+        return False
+
+    attention_cls.forward = sdpa_forward
+    attention_cls._sdpa_patched = True
+    return True
+
 
-    # processor
+def load_processor():
     if os.path.isdir(PROCESSOR_DIR):
-        processor = BlipProcessor.from_pretrained(PROCESSOR_DIR)
-    else:
-        processor = BlipProcessor.from_pretrained(BASE_MODEL)
+        return BlipProcessor.from_pretrained(PROCESSOR_DIR)
+    return BlipProcessor.from_pretrained(BASE_MODEL)
+
+
+def load_model():
+    """
+    1) processor 로드
+    2) merge된 체크포인트가 있으면 바로 로드
+       (없으면 BLIP base 모델 로드 후 LoRA adapter를 merge)
+    """
+    print("🔄 BLIP + LoRA 모델 로딩 중...")
 
-    # base 모델
-    base_model = BlipForConditionalGeneration.from_pretrained(BASE_MODEL)
+    processor = load_processor()
 
-    # LoRA 어댑터 merge
-    if os.path.isdir(ADAPTER_DIR):
+    if os.path.isdir(MERGED_DIR):
+        # 시작할 때마다 merge하지 않으므로 피크 메모리 / 시작 시간이 줄어듦
+        print("🔹 merge된 체크포인트 로드...")
+        model = BlipForConditionalGeneration.from_pretrained(
+            MERGED_DIR,
+            torch_dtype=torch.bfloat16 if BLIP_PRECISION == "bf16" else torch.float32,
+            low_cpu_mem_usage=True,
+        )
+    elif os.path.isdir(ADAPTER_DIR):
+        # base 모델 + LoRA 어댑터 merge
         print("🔹 LoRA 어댑터 적용...")
+        base_model = BlipForConditionalGeneration.from_pretrained(BASE_MODEL)
         lora_model = PeftModel.from_pretrained(base_model, ADAPTER_DIR)
         model = lora_model.merge_and_unload()
     else:
         print("⚠ adapter 폴더 없음 → base 모델만 사용")
-        model = base_model
+        model = BlipForConditionalGeneration.from_pretrained(BASE_MODEL)
+
+    # 양자화 전 가중치로 원래 attention과 비교한 뒤 교체
+    if BLIP_SDPA and enable_sdpa_attention(model):
+        print("🔹 vision encoder SDPA attention 적용")
+
+    # Linear 가중치를 int8로 동적 양자화 (CPU VNNI 커널 사용, 메모리 1/4)
+    if BLIP_PRECISION == "int8":
+        print("🔹 int8 동적 양자화 적용...")
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    elif BLIP_PRECISION == "bf16":
+        print("🔹 bf16 가중치 사용...")
+        model = model.to(torch.bfloat16)
 
     model.to(DEVICE)
     model.eval()
+
+    # vision encoder의 patch embedding conv가 oneDNN NHWC 커널을 쓰도록
+    model = model.to(memory_format=torch.channels_last)
+
+    # generate()는 내부에서 vision_model / text_decoder를 직접 부르기 때문에
+    # 모델 전체가 아니라 두 서브모듈의 forward를 컴파일해야 효과가 있음
+    if BLIP_COMPILE:
+        print("🔹 torch.compile 적용 (reduce-overhead)...")
+        model.vision_model.forward = torch.compile(
+            model.vision_model.forward, mode="reduce-overhead", fullgraph=False
+        )
+        model.text_decoder.forward = torch.compile(
+            model.text_decoder.forward, mode="reduce-overhead", fullgraph=False
+        )
+
     print("✅ BLIP 로딩 완료!")
     return processor, model
 
 
-processor, blip_model = load_model()
+def blip_image_size(processor) -> tuple:
+    """processor 기본 입력 크기 (width, height). BLIP base는 384x384"""
+    size = processor.image_processor.size
+    return (size["width"], size["height"])
+
+
+def warmup_model(processor, model):
+    """
+    더미 이미지로 generate를 돌려서
+    torch.compile 컴파일 비용을 서버 시작 시점에 미리 지불.
+    배치 크기 1과 BLIP_MAX_BATCH_SIZE 두 번 돌려서, 두 번째에 배치 차원이
+    dynamic으로 재컴파일되도록 함 (요청 처리 중 재컴파일 방지)
+    """
+    if not BLIP_COMPILE:
+        return
+
+    print("🔄 BLIP 워밍업 중 (최초 컴파일은 1분 이상 걸릴 수 있음)...")
+    start = time.time()
+    dummy = Image.new("RGB", blip_image_size(processor))
+    for batch_size in sorted({1, BLIP_MAX_BATCH_SIZE}):
+        inputs = processor(images=[dummy] * batch_size, return_tensors="pt").to(DEVICE)
+        with torch.inference_mode():
+            model.generate(
+                pixel_values=inputs.pixel_values.to(model.dtype),
+                **BLIP_GENERATE_KWARGS,
+            )
+    print(f"✅ BLIP 워밍업 완료 ({time.time() - start:.1f}s)")
+
+
+def load_stt_model():
+    """faster-whisper 모델 로드 (STT_BACKEND=local 이고 패키지가 있을 때만)"""
+    if STT_BACKEND != "local":
+        return None
+    if WhisperModel is None:
+        print("⚠ faster-whisper 없음 → OpenAI Whisper 사용")
+        return None
+
+    print(f"🔄 faster-whisper({WHISPER_MODEL_SIZE}, int8) 로딩 중...")
+    model = WhisperModel(WHISPER_MODEL_SIZE, device="cpu", compute_type="int8")
+    print("✅ faster-whisper 로딩 완료!")
+    return model
 
 
 # -----------------------------
-#  유틸 함수들
+#  이미지 해시 기반 캐시
 # -----------------------------
-def blip_caption_from_base64(image_b64: str) -> str:
-    """Base64 이미지에서 BLIP 캡션 뽑기"""
-    img_bytes = base64.b64decode(image_b64)
-    pil_image = Image.open(BytesIO(img_bytes)).convert("RGB")
+class LRUCache:
+    """스레드 안전한 간단 LRU (OrderedDict). on_evict(key, value)는 밀려날 때 호출"""
+
+    def __init__(self, max_size: int, on_evict=None):
+        self.max_size = max_size
+        self.on_evict = on_evict
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        evicted = []
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                evicted.append(self._data.popitem(last=False))
+
+        if self.on_evict is not None:
+            for old_key, old_value in evicted:
+                self.on_evict(old_key, old_value)
 
-    inputs = processor(images=pil_image, return_tensors="pt").to(DEVICE)
-    with torch.no_grad():
+
+def image_sha256(img_bytes: bytes) -> str:
+    return hashlib.sha256(img_bytes).hexdigest()
+
+
+# 업로드 파일 삭제 태스크 참조 (GC 방지)
+file_delete_tasks = set()
+
+
+def delete_uploaded_image(image_hash: str, file_id: str):
+    """file_id 캐시에서 밀려난 이미지는 OpenAI 파일 저장소에서도 삭제"""
+
+    async def delete():
+        try:
+            await llm_client.files.delete(file_id)
+            print("[이미지 업로드 삭제]", file_id)
+        except Exception as e:
+            print("[ERROR] 업로드 이미지 삭제 실패:", file_id, e)
+
+    task = asyncio.get_running_loop().create_task(delete())
+    file_delete_tasks.add(task)
+    task.add_done_callback(file_delete_tasks.discard)
+
+
+# sha256 -> OpenAI에 업로드한 이미지 file_id (밀려나면 업로드 파일도 삭제)
+image_file_cache = LRUCache(IMAGE_FILE_CACHE_SIZE, on_evict=delete_uploaded_image)
+
+# sha256 -> {"raw_caption", "korean_caption"} (/api/caption 결과, 음성은 TTS 파일 캐시 재사용)
+caption_cache = LRUCache(CAPTION_CACHE_SIZE)
+
+# 스트리밍 TTS 토큰 -> 읽어줄 텍스트 또는 SpeechJob (/tts/stream/<token>)
+tts_streams = LRUCache(256)
+
+
+# -----------------------------
+#  BLIP 동적 배칭 워커
+# -----------------------------
+# (image, Future) 가 쌓이는 큐. 워커 스레드 하나가 모아서 처리
+caption_queue = queue.Queue()
+
+
+def blip_caption_batch(images: list) -> list:
+    """여러 장의 이미지를 한 번의 generate로 캡셔닝"""
+    # decode_image에서 이미 입력 크기로 맞췄으므로 processor 리사이즈는 생략
+    inputs = processor(images=images, do_resize=False, return_tensors="pt").to(DEVICE)
+
+    with torch.inference_mode():
         output_ids = blip_model.generate(
-            **inputs,
-            max_length=40,
-            num_beams=5,
-            no_repeat_ngram_size=2,
+            pixel_values=inputs.pixel_values.to(blip_model.dtype),
+            **BLIP_GENERATE_KWARGS,
         )
 
-    caption = processor.decode(output_ids[0], skip_special_tokens=True).strip()
+    captions = processor.batch_decode(output_ids, skip_special_tokens=True)
+    return [c.strip() for c in captions]
+
+
+def init_blip_worker():
+    """BLIP 워커 프로세스 초기화: 코어를 나눠 쓰고 자기 모델을 한 번 로드"""
+    global processor, blip_model
+    torch.set_num_threads(max(1, os.cpu_count() // BLIP_WORKERS))
+    processor, blip_model = load_model()
+    warmup_model(processor, blip_model)
+
+
+def create_blip_pool() -> ProcessPoolExecutor:
+    """
+    BLIP 워커 프로세스 풀 생성.
+    워커가 죽으면 Pool처럼 멈추지 않고 BrokenProcessPool로 실패함
+    """
+    print(f"🔄 BLIP 워커 프로세스 {BLIP_WORKERS}개 시작...")
+    pool = ProcessPoolExecutor(
+        max_workers=BLIP_WORKERS,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=init_blip_worker,
+    )
+    # 첫 submit에서 워커들이 fork되므로 지금 바로 한 번 돌려서
+    # 워커를 미리 띄우고, 초기화(모델 로드) 실패도 여기서 드러나게 함
+    pool.submit(os.getpid).result()
+    return pool
+
+
+# -----------------------------
+#  모델 로딩
+# -----------------------------
+if BLIP_WORKERS > 1:
+    # 모델/스레드가 생기기 전에 fork 해야 각 워커가 깨끗한 상태에서 시작함.
+    # (워커 함수들이 모두 정의된 뒤여야 워커 쪽에서 찾을 수 있음)
+    blip_pool = create_blip_pool()
+    # 서버 프로세스는 입력 크기 계산용 processor만 필요
+    processor, blip_model = load_processor(), None
+else:
+    blip_pool = None
+    processor, blip_model = load_model()
+    warmup_model(processor, blip_model)
+
+stt_model = load_stt_model()
+
+
+# -----------------------------
+#  배칭 워커 스레드
+# -----------------------------
+# 워커 프로세스에 동시에 넘길 수 있는 배치 수
+blip_slots = threading.Semaphore(BLIP_WORKERS)
+
+# 깨진 워커 풀을 한 번만 다시 만들도록
+blip_pool_lock = threading.Lock()
+
+
+def restart_blip_pool(broken_pool: ProcessPoolExecutor):
+    """
+    워커가 죽어서 깨진 풀을 새 풀로 교체 (여러 곳에서 동시에 불려도 한 번만).
+    BLIP_WORKERS > 1이면 서버 프로세스는 torch 연산을 돌리지 않으므로
+    실행 중에 다시 fork 해도 워커가 OpenMP 상태를 물려받지 않음
+    """
+    global blip_pool
+    with blip_pool_lock:
+        if blip_pool is not broken_pool:
+            return
+        print("⚠ BLIP 워커 프로세스 종료 감지 → 워커 풀 재시작")
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+        blip_pool = create_blip_pool()
+
+
+def submit_blip_batch(images: list) -> tuple:
+    """워커 풀에 배치를 넘김. 풀이 깨져 있으면 다시 만든 뒤 넘김. (pool, future) 반환"""
+    pool = blip_pool
+    try:
+        return pool, pool.submit(blip_caption_batch, images)
+    except BrokenProcessPool:
+        restart_blip_pool(pool)
+        pool = blip_pool
+        return pool, pool.submit(blip_caption_batch, images)
+
+
+def restart_blip_pool_in_background(broken_pool: ProcessPoolExecutor):
+    """다음 요청을 기다리지 않고 바로 워커 풀 재시작 (모델 로드가 길어서 별도 스레드)"""
+
+    def restart():
+        try:
+            restart_blip_pool(broken_pool)
+        except Exception as e:
+            # 다음 배치를 넘길 때 다시 시도함
+            print("[ERROR] BLIP 워커 풀 재시작 실패:", e)
+
+    threading.Thread(target=restart, daemon=True).start()
+
+
+def finish_batch(batch: list, captions: list = None, error: Exception = None):
+    """배치 결과(또는 오류)를 각 요청의 Future에 전달"""
+    if error is not None:
+        print("[ERROR] BLIP 배치 추론 실패:", error)
+        for _, future in batch:
+            future.set_exception(error)
+        return
+
+    print(f"[BLIP 배치] {len(batch)}장 처리")
+    for (_, future), caption in zip(batch, captions):
+        future.set_result(caption)
+
+
+def caption_worker():
+    """
+    큐에서 첫 요청을 기다린 뒤, BLIP_BATCH_TIMEOUT 동안
+    최대 BLIP_MAX_BATCH_SIZE 장까지 모아서 한 번에 추론.
+    워커 프로세스가 있으면 비어 있는 워커에 배치를 넘기고 바로 다음 배치를 모음.
+    """
+    while True:
+        batch = [caption_queue.get()]
+        deadline = time.time() + BLIP_BATCH_TIMEOUT
+        while len(batch) < BLIP_MAX_BATCH_SIZE:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(caption_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        # 이미 타임아웃으로 취소된 요청은 빼고, 나머지는 실행 중으로 표시해서
+        # 이후에는 취소되지 않게 함 (결과 전달 시 InvalidStateError 방지)
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            continue
+        images = [image for image, _ in batch]
+
+        if blip_pool is None:
+            try:
+                captions = blip_caption_batch(images)
+            except Exception as e:
+                finish_batch(batch, error=e)
+                continue
+            finish_batch(batch, captions)
+            continue
+
+        blip_slots.acquire()
+        try:
+            pool, result = submit_blip_batch(images)
+        except Exception as e:
+            # 풀 재시작까지 실패한 경우
+            blip_slots.release()
+            finish_batch(batch, error=e)
+            continue
+
+        def on_done(result, batch=batch, pool=pool):
+            blip_slots.release()
+            error = result.exception()
+            if isinstance(error, BrokenProcessPool):
+                restart_blip_pool_in_background(pool)
+            if error is not None:
+                finish_batch(batch, error=error)
+            else:
+                finish_batch(batch, result.result())
+
+        result.add_done_callback(on_done)
+
+
+threading.Thread(target=caption_worker, daemon=True).start()
+
+
+# -----------------------------
+#  유틸 함수들
+# -----------------------------
+def decode_image(img_bytes: bytes) -> np.ndarray:
+    """
+    이미지 디코딩 + BLIP 입력 크기로 리사이즈 (RGB uint8 배열).
+    JPEG은 turbojpeg, 리사이즈는 cv2를 우선 사용.
+    """
+    # 입력 크기를 고정해서 컴파일된 그래프가 재컴파일되지 않게
+    size = blip_image_size(processor)
+
+    arr = None
+    if jpeg_decoder is not None and img_bytes[:2] == b"\xff\xd8":
+        try:
+            arr = jpeg_decoder.decode(img_bytes, pixel_format=TJPF_RGB)
+        except Exception as e:
+            # CMYK 등 turbojpeg가 RGB로 못 바꾸는 JPEG은 PIL로
+            print("[turbojpeg 디코딩 실패 → PIL 사용]", e)
+    if arr is None:
+        arr = np.asarray(Image.open(BytesIO(img_bytes)).convert("RGB"))
+
+    # processor 설정(resample=3, bicubic)과 같은 보간을 써서
+    # cv2 유무에 따라 모델 입력이 달라지지 않게 함
+    if cv2 is not None:
+        return cv2.resize(arr, size, interpolation=cv2.INTER_CUBIC)
+    return np.asarray(Image.fromarray(arr).resize(size, Image.BICUBIC))
+
+
+async def blip_caption_from_bytes(img_bytes: bytes) -> str:
+    """이미지 바이트에서 BLIP 캡션 뽑기 (배칭 워커에 넘기고 결과 대기)"""
+    image = await asyncio.to_thread(decode_image, img_bytes)
+
+    future = Future()
+    caption_queue.put((image, future))
+    caption = await asyncio.wait_for(asyncio.wrap_future(future), BLIP_TIMEOUT)
     print("[BLIP 캡션]", caption)
     return caption
 
 
-def make_korean_caption(raw_caption: str) -> str:
+async def make_korean_caption(raw_caption: str) -> tuple:
     """
     BLIP가 뽑은 캡션(raw_caption)을
     시각장애인이 듣기 좋은 자연스러운 한국어 한두 문장으로 정리.
     (OPENAI_API_KEY 없으면 그냥 원문 사용)
+    LLM 응답을 스트리밍으로 받으면서 바로 TTS를 시작하고 (text, tts_url) 반환.
     """
     if llm_client is None:
-        return raw_caption
+        return raw_caption, register_tts_stream(raw_caption)
 
-    completion = llm_client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "너는 시각장애인을 위한 화면 설명 도우미야. "
-                    "입력된 문장을 바탕으로, 자연스러운 한국어 한두 문장으로 "
-                    "존댓말로 설명해줘. 군더더기 없이 핵심만 말해."
-                ),
-            },
+    messages = [
+        {
+            "role": "system",
+            "content": (
+                "너는 시각장애인을 위한 화면 설명 도우미야. "
+                "입력된 문장을 바탕으로, 자연스러운 한국어 한두 문장으로 "
+                "존댓말로 설명해줘. 군더더기 없이 핵심만 말해."
+            ),
+        },
+        {
+            "role": "user",
+            "content": f"다음 캡션을 한국어로 정리해줘: {raw_caption}",
+        },
+    ]
+
+    key = cache_key(LLM_MODEL, messages)
+    # 캡션은 exact 캐시만 사용 (비슷한 문장이라도 다른 장면일 수 있음)
+    cached = await llm_cache.get(key)
+    if cached is not None:
+        print("[한국어 캡션 (캐시)]", cached)
+        return cached, register_tts_stream(cached)
+
+    stream = await llm_client.chat.completions.create(
+        model=LLM_MODEL,
+        messages=messages,
+        stream=True,
+    )
+
+    async def deltas():
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    text, tts_url = await speak_llm_stream(deltas())
+    print("[한국어 캡션]", text)
+    await llm_cache.set(key, text)
+    return text, tts_url
+
+
+async def image_input(image_hash: str, img_bytes: bytes) -> dict:
+    """
+    Responses API용 input_image.
+    이미지는 한 번만 업로드하고 file_id를 재사용 (업로드 실패 시 data URL로 전송)
+    """
+    file_id = image_file_cache.get(image_hash)
+    if file_id is None:
+        try:
+            uploaded = await llm_client.files.create(
+                file=("image.jpg", img_bytes, "image/jpeg"), purpose="vision"
+            )
+            file_id = uploaded.id
+            image_file_cache.set(image_hash, file_id)
+            print("[이미지 업로드]", file_id)
+        except Exception as e:
+            print("[ERROR] 이미지 업로드 실패 (data URL 사용):", e)
+            return {
+                "type": "input_image",
+                "image_url": "data:image/jpeg;base64,"
+                + base64.b64encode(img_bytes).decode("ascii"),
+            }
+
+    return {"type": "input_image", "file_id": file_id}
+
+
+async def vision_answer(question: str, img_bytes: bytes) -> tuple:
+    """
+    이미지 + 질문으로 Vision Q&A. (answer, tts_url) 반환.
+    같은 이미지(sha256)에 같은/비슷한 질문이면 캐시된 답변 사용.
+    """
+    image_hash = image_sha256(img_bytes)
+    key = cache_key(
+        LLM_MODEL,
+        [{"role": "user", "content": [question, {"image_sha256": image_hash}]}],
+    )
+    cached = await llm_cache.get(key)
+    if cached is not None:
+        return cached, register_tts_stream(cached)
+
+    # 비슷한 질문 조회(임베딩)는 LLM 요청 전에 끝내서 hit이면 LLM 비용이 들지 않게 함.
+    # 그동안 이미지 업로드를 같이 진행해서 임베딩 왕복 지연을 가림
+    similar, image = await asyncio.gather(
+        llm_cache.get_similar(question, namespace=image_hash),
+        image_input(image_hash, img_bytes),
+    )
+    if similar is not None:
+        return similar, register_tts_stream(similar)
+
+    stream = await llm_client.responses.create(
+        model=LLM_MODEL,
+        input=[
             {
                 "role": "user",
-                "content": f"다음 캡션을 한국어로 정리해줘: {raw_caption}",
-            },
+                "content": [
+                    {
+                        "type": "input_text",
+                        "text": VISION_QA_PROMPT.format(question=question),
+                    },
+                    image,
+                ],
+            }
         ],
+        stream=True,
     )
-    text = completion.choices[0].message.content.strip()
-    print("[한국어 캡션]", text)
-    return text
 
+    async def deltas():
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                yield event.delta
 
-def save_tts_korean(text: str, filename: str) -> str:
-    """간단 TTS 생성 (gTTS 한국어) -> static/tts/filename.mp3"""
-    path = os.path.join(TTS_DIR, filename)
-    print(f"[TTS] 저장 경로: {path}")
-    tts = gTTS(text=text, lang="ko")
-    tts.save(path)
-    return path
+    answer_text, tts_url = await speak_llm_stream(deltas())
+    await llm_cache.set(key, answer_text, text=question, namespace=image_hash)
+    return answer_text, tts_url
 
 
-def stt_korean_file(audio_file) -> str:
+async def stream_tts_korean(text: str):
+    """
+    한국어 TTS mp3 바이트를 생성되는 대로 yield.
+    OpenAI TTS 스트리밍을 쓰고, API 키가 없으면 gTTS로 문장 단위 스트리밍.
+    """
+    if llm_client is not None:
+        async with llm_client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format="mp3",
+        ) as resp:
+            async for chunk in resp.iter_bytes(4096):
+                yield chunk
+        return
+
+    # gTTS.stream()은 동기 제너레이터라 한 조각씩 스레드에서 꺼냄
+    chunks = gTTS(text=text, lang="ko").stream()
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, None)
+        if chunk is None:
+            break
+        yield chunk
+
+
+# tts_filename()이 만드는 파일명 (blake2b 12바이트 hex)
+TTS_HASH_FILENAME = re.compile(r"[0-9a-f]{24}\.mp3")
+
+
+def tts_filename(text: str) -> str:
+    """
+    같은 문장 + 같은 음성 설정이면 항상 같은 파일명 (내용 해시).
+    TTS 백엔드/모델/목소리를 바꾸면 예전 음성 파일을 재사용하지 않음.
+    """
+    if llm_client is not None:
+        voice_key = f"openai|{TTS_MODEL}|{TTS_VOICE}"
+    else:
+        voice_key = "gtts|ko"
+    key = f"{voice_key}|{text}"
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()
+    return f"{digest}.mp3"
+
+
+async def save_tts_file(text: str, audio: bytes):
+    """합성이 끝난 mp3를 내용 해시 파일명으로 저장 (임시 파일에 쓰고 교체)"""
+    path = os.path.join(TTS_DIR, tts_filename(text))
+    tmp_path = f"{path}.{secrets.token_hex(4)}.part"
+    async with aiofiles.open(tmp_path, "wb") as f:
+        await f.write(audio)
+    os.replace(tmp_path, path)
+    print(f"[TTS] 저장: {path}")
+
+
+def register_tts_stream(text: str) -> str:
+    """
+    텍스트를 등록하고 스트리밍 재생 URL을 돌려줌 (합성은 재생 요청 시 시작).
+    이미 합성된 적 있는 문장이면 저장된 파일 URL을 바로 돌려줌.
+    """
+    filename = tts_filename(text)
+    if os.path.exists(os.path.join(TTS_DIR, filename)):
+        return f"/tts/{filename}"
+
+    token = secrets.token_urlsafe(12)
+    tts_streams.set(token, text)
+    return f"/tts/stream/{token}"
+
+
+class SpeechJob:
+    """
+    LLM 텍스트 조각을 받아 문장이 끝날 때마다 TTS 합성을 시작하고,
+    나온 mp3 조각을 버퍼에 쌓아두는 작업.
+    LLM 생성과 TTS 합성이 겹쳐서 돌아가므로 전체 지연 ≈ max(LLM, TTS).
+    """
+
+    def __init__(self):
+        self.text = asyncio.get_running_loop().create_future()
+        self.chunks = []
+        self.done = False
+        self._updated = asyncio.Condition()
+
+    async def _append(self, chunk: bytes):
+        async with self._updated:
+            self.chunks.append(chunk)
+            self._updated.notify_all()
+
+    async def run(self, deltas):
+        sentences = asyncio.Queue()
+
+        async def produce():
+            parts, buf = [], ""
+            try:
+                async for delta in deltas:
+                    parts.append(delta)
+                    buf += delta
+                    while (m := SENTENCE_END.search(buf)) is not None:
+                        sentences.put_nowait(buf[: m.end()].strip())
+                        buf = buf[m.end() :]
+                if buf.strip():
+                    sentences.put_nowait(buf.strip())
+                self.text.set_result("".join(parts).strip())
+            except Exception as e:
+                self.text.set_exception(e)
+            finally:
+                sentences.put_nowait(None)
+
+        async def synthesize():
+            while (sentence := await sentences.get()) is not None:
+                if not sentence:
+                    continue
+                async for chunk in stream_tts_korean(sentence):
+                    await self._append(chunk)
+
+        failed = False
+        try:
+            await asyncio.gather(produce(), synthesize())
+        except Exception as e:
+            print("[ERROR] 스트리밍 TTS 실패:", e)
+            failed = True
+        finally:
+            async with self._updated:
+                self.done = True
+                self._updated.notify_all()
+
+        # 끝까지 합성된 경우만 파일로 저장 (다음부터는 /tts/<해시>.mp3 로 바로 재생)
+        if not failed and self.text.exception() is None:
+            await save_tts_file(self.text.result(), b"".join(self.chunks))
+
+    async def iter_audio(self):
+        """지금까지 쌓인 조각부터 합성이 끝날 때까지 순서대로 yield"""
+        sent = 0
+        while True:
+            async with self._updated:
+                await self._updated.wait_for(
+                    lambda: sent < len(self.chunks) or self.done
+                )
+                new_chunks = self.chunks[sent:]
+                done = self.done
+            for chunk in new_chunks:
+                yield chunk
+            sent += len(new_chunks)
+            if done and sent >= len(self.chunks):
+                return
+
+
+# 실행 중인 SpeechJob 태스크 참조 (GC 방지)
+speech_tasks = set()
+
+
+def start_speech_job(token: str, deltas) -> SpeechJob:
+    """토큰에 SpeechJob을 등록하고 백그라운드에서 합성 시작"""
+    job = SpeechJob()
+    tts_streams.set(token, job)
+
+    task = asyncio.create_task(job.run(deltas))
+    speech_tasks.add(task)
+    task.add_done_callback(speech_tasks.discard)
+    return job
+
+
+async def speak_llm_stream(deltas) -> tuple:
+    """
+    LLM 델타 스트림으로 SpeechJob을 시작하고,
+    텍스트가 완성되면 (text, tts_url) 반환. TTS는 백그라운드에서 계속 진행.
+    """
+    token = secrets.token_urlsafe(12)
+    job = start_speech_job(token, deltas)
+    text = await job.text
+    return text, f"/tts/stream/{token}"
+
+
+async def text_deltas(text: str):
+    """이미 완성된 텍스트를 SpeechJob 입력(델타 스트림)으로"""
+    yield text
+
+
+async def stt_korean_file(audio_bytes: bytes) -> str:
     """
     업로드된 오디오 파일(웹m 등)을 Whisper로 한국어 텍스트로 변환.
+    로컬 faster-whisper가 있으면 네트워크 없이 처리, 없으면 OpenAI Whisper.
     """
-    if llm_client is None:
+    if stt_model is None and llm_client is None:
         return ""
 
-    tmp_name = f"voice_{int(time.time())}.webm"
-    tmp_path = os.path.join(TTS_DIR, tmp_name)
-    audio_file.save(tmp_path)
-    print(f"[STT] 임시 오디오 저장: {tmp_path}")
+    if stt_model is not None:
 
-    with open(tmp_path, "rb") as f:
-        result = llm_client.audio.transcriptions.create(
-            model="whisper-1",
-            file=f,
-            language="ko",
-        )
+        def transcribe():
+            # 파일로 저장하지 않고 메모리에서 바로 디코딩 (요청 간 경합 / 잔여 파일 없음)
+            segments, _ = stt_model.transcribe(
+                BytesIO(audio_bytes), language="ko", vad_filter=True
+            )
+            return " ".join(s.text for s in segments).strip()
+
+        text = await asyncio.to_thread(transcribe)
+        print("[STT 결과 (local)]", text)
+        return text
+
+    result = await llm_client.audio.transcriptions.create(
+        model="whisper-1",
+        file=("voice.webm", audio_bytes),
+        language="ko",
+    )
     print("[STT 결과]", result.text)
     return result.text.strip()
 
@@ -164,51 +981,118 @@ def stt_korean_file(audio_file) -> str:
 #  라우터
 # -----------------------------
 @app.route("/")
-def index():
+async def index():
     # templates/index.html 렌더링
-    return render_template("index.html")
+    return await render_template("index.html")
 
 
 # 🔊 TTS mp3 서빙
 @app.route("/tts/<filename>")
-def serve_tts(filename):
+async def serve_tts(filename):
     print(f"[TTS 서빙 요청] {filename}")
-    return send_from_directory(TTS_DIR, filename)
+    response = await send_from_directory(TTS_DIR, filename)
+    # 내용 해시 파일명(tts_filename)만 내용이 바뀌지 않음 → 브라우저/CDN이 영구 캐시.
+    # 그 외 예전 파일(caption.mp3 등)은 덮어써질 수 있으므로 기본 캐시 정책 유지
+    if TTS_HASH_FILENAME.fullmatch(filename):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
+
+# 🔊 TTS 스트리밍: 첫 mp3 조각이 나오는 즉시 재생 시작
+@app.route("/tts/stream/<token>")
+async def serve_tts_stream(token):
+    entry = tts_streams.get(token)
+    if entry is None:
+        return jsonify({"error": "unknown tts token"}), 404
+
+    print(f"[TTS 스트리밍 요청] {token}")
+    if isinstance(entry, str):
+        if os.path.exists(os.path.join(TTS_DIR, tts_filename(entry))):
+            return redirect(f"/tts/{tts_filename(entry)}")
+        # 처음 재생할 때 합성 시작. 같은 토큰을 다시 요청하면 버퍼를 재생 (TTS 재호출 없음)
+        entry = start_speech_job(token, text_deltas(entry))
+
+    # 합성이 끝나 파일로 저장됐으면 파일로 보냄
+    # (Content-Length / Range 지원 → iOS Safari <audio>도 탐색/재생 가능)
+    if entry.done and entry.text.done() and entry.text.exception() is None:
+        filename = tts_filename(entry.text.result())
+        if os.path.exists(os.path.join(TTS_DIR, filename)):
+            return redirect(f"/tts/{filename}")
+    return Response(entry.iter_audio(), mimetype="audio/mpeg")
+
+
+async def request_field(name: str):
+    """multipart/form 필드 우선, 없으면 JSON 본문에서 값 꺼내기"""
+    form = await request.form
+    if name in form:
+        return form.get(name)
+    if request.is_json:
+        data = await request.get_json()
+        return data.get(name)
+    return None
+
+
+async def request_image_bytes():
+    """
+    요청에서 이미지 바이트 꺼내기.
+    multipart 'image' 파일 필드 우선, 없으면 base64 / dataURL 문자열 (이전 클라이언트 호환).
+    base64가 깨져 있으면 ValueError (binascii.Error)
+    """
+    files = await request.files
+    image_file = files.get("image")
+    if image_file:
+        return image_file.read()
+
+    image_b64 = await request_field("image")
+    if not image_b64:
+        return None
+
+    # dataURL 형식일 경우 앞부분 제거
+    if "," in image_b64:
+        image_b64 = image_b64.split(",", 1)[1]
+    return base64.b64decode(image_b64)
 
 
 # -----------------------------
 # 1) 캡션: 지금 장면 설명 + 한국어 TTS
 # -----------------------------
 @app.route("/api/caption", methods=["POST"])
-def api_caption():
-    data = request.get_json()
-    image_b64 = data.get("image")
+async def api_caption():
+    try:
+        img_bytes = await request_image_bytes()
+    except ValueError as e:
+        print("[ERROR] image decode error:", e)
+        return jsonify({"error": f"image decode error: {e}"}), 400
 
-    if not image_b64:
+    if not img_bytes:
         return jsonify({"error": "image field not found"}), 400
 
-    # dataURL 형식일 경우 앞부분 제거
-    if "," in image_b64:
-        image_b64 = image_b64.split(",", 1)[1]
+    # 같은 이미지면 BLIP + LLM + TTS 전체를 건너뜀
+    image_hash = image_sha256(img_bytes)
+    cached = caption_cache.get(image_hash)
+    if cached is not None:
+        print("[캡션 캐시 HIT]", image_hash[:12])
+        return jsonify(
+            {
+                "raw_caption": cached["raw_caption"],
+                "korean_caption": cached["korean_caption"],
+                "tts_url": register_tts_stream(cached["korean_caption"]),
+            }
+        )
 
     try:
-        raw_caption = blip_caption_from_base64(image_b64)
+        raw_caption = await blip_caption_from_bytes(img_bytes)
     except Exception as e:
         print("[ERROR] caption error:", e)
         return jsonify({"error": f"caption error: {e}"}), 500
 
-    korean_caption = make_korean_caption(raw_caption)
+    # 한국어 설명 + TTS (LLM 스트리밍과 TTS 합성이 동시에 진행)
+    korean_caption, tts_url = await make_korean_caption(raw_caption)
+    print("[TTS URL]", tts_url)
 
-    # 한국어 설명을 TTS로 읽어주기
-    tts_url = None
-    try:
-        filename = "caption.mp3"
-        tts_path = save_tts_korean(korean_caption, filename)
-        tts_url = f"/tts/{filename}"
-        print("[TTS URL]", tts_url)
-    except Exception as e:
-        print("[ERROR] TTS 생성 실패:", e)
-        tts_url = None
+    caption_cache.set(
+        image_hash, {"raw_caption": raw_caption, "korean_caption": korean_caption}
+    )
 
     return jsonify(
         {
@@ -223,7 +1107,7 @@ def api_caption():
 # 2) 텍스트 채팅 Q&A
 # -----------------------------
 @app.route("/api/ask", methods=["POST"])
-def api_ask():
+async def api_ask():
     if llm_client is None:
         return jsonify(
             {
@@ -233,45 +1117,21 @@ def api_ask():
             }
         )
 
-    data = request.get_json()
-    question = (data.get("question") or "").strip()
-    image_b64 = data.get("image")
+    question = (await request_field("question") or "").strip()
+    try:
+        img_bytes = await request_image_bytes()
+    except ValueError as e:
+        print("[ERROR] image decode error:", e)
+        return jsonify({"answer": "이미지 형식이 올바르지 않습니다.", "error": True})
 
     if not question:
         return jsonify({"answer": "질문이 비어 있습니다.", "error": True})
 
-    if not image_b64:
+    if not img_bytes:
         return jsonify({"answer": "이미지가 전송되지 않았습니다.", "error": True})
 
-    if "," in image_b64:
-        image_b64 = image_b64.split(",", 1)[1]
-
     try:
-        response = llm_client.responses.create(
-            model="gpt-4o-mini",
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "너는 시각장애인을 위한 장면 설명 도우미야. "
-                                "아래 이미지를 보고, 사용자의 질문에 대해 "
-                                "한국어로 1~2문장 정도로 짧고 분명하게 대답해 줘.\n\n"
-                                f"질문: {question}"
-                            ),
-                        },
-                        {
-                            "type": "input_image",
-                            "image_url": "data:image/jpeg;base64," + image_b64,
-                        },
-                    ],
-                }
-            ],
-        )
-
-        answer_text = response.output[0].content[0].text.strip()
+        answer_text, tts_url = await vision_answer(question, img_bytes)
         print("[텍스트 Q&A 답변]", answer_text)
 
     except Exception as e:
@@ -280,16 +1140,8 @@ def api_ask():
             {"answer": f"LLM 호출 중 오류가 발생했습니다: {e}", "error": True}
         )
 
-    # 답변도 TTS로 읽어주기
-    tts_url = None
-    try:
-        filename = f"answer_{int(time.time())}.mp3"
-        save_tts_korean(answer_text, filename)
-        tts_url = f"/tts/{filename}"
-        print("[Q&A TTS URL]", tts_url)
-    except Exception as e:
-        print("[ERROR] Q&A TTS 실패:", e)
-        tts_url = None
+    # 답변 TTS는 vision_answer에서 스트리밍으로 이미 시작됨
+    print("[Q&A TTS URL]", tts_url)
 
     return jsonify({"answer": answer_text, "error": False, "tts_url": tts_url})
 
@@ -298,7 +1150,7 @@ def api_ask():
 # 3) 음성 Q&A: 음성 → STT → Vision Q&A
 # -----------------------------
 @app.route("/api/voice-ask", methods=["POST"])
-def api_voice_ask():
+async def api_voice_ask():
     if llm_client is None:
         return jsonify(
             {
@@ -307,71 +1159,45 @@ def api_voice_ask():
             }
         )
 
-    audio_file = request.files.get("audio")
-    image_b64 = request.form.get("image")
+    files = await request.files
+    audio_file = files.get("audio")
+    try:
+        img_bytes = await request_image_bytes()
+    except ValueError as e:
+        print("[ERROR] image decode error:", e)
+        return jsonify({"answer": "이미지 형식이 올바르지 않습니다.", "error": True})
 
     if not audio_file:
         return jsonify({"answer": "오디오가 전송되지 않았습니다.", "error": True})
 
-    if not image_b64:
+    if not img_bytes:
         return jsonify({"answer": "이미지가 전송되지 않았습니다.", "error": True})
 
-    # 1) STT로 질문 텍스트 얻기
+    audio_bytes = audio_file.read()
+
+    # 1) STT로 질문 텍스트 얻기 (그동안 이미지 업로드도 같이 진행)
     try:
-        question_text = stt_korean_file(audio_file)
+        question_text, _ = await asyncio.gather(
+            stt_korean_file(audio_bytes),
+            image_input(image_sha256(img_bytes), img_bytes),
+        )
         if not question_text:
             return jsonify({"answer": "음성을 인식하지 못했습니다.", "error": True})
     except Exception as e:
         print("[ERROR] STT 오류:", e)
         return jsonify({"answer": f"STT 오류: {e}", "error": True})
 
-    # 2) base64 헤더 제거
-    if "," in image_b64:
-        image_b64 = image_b64.split(",", 1)[1]
-
-    # 3) Vision Q&A 호출
+    # 2) Vision Q&A 호출
     try:
-        response = llm_client.responses.create(
-            model="gpt-4o-mini",
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "너는 시각장애인을 위한 장면 설명 도우미야. "
-                                "아래 이미지를 보고, 사용자의 질문에 대해 "
-                                "한국어로 1~2문장 정도로 짧고 분명하게 대답해 줘.\n\n"
-                                f"질문: {question_text}"
-                            ),
-                        },
-                        {
-                            "type": "input_image",
-                            "image_url": "data:image/jpeg;base64," + image_b64,
-                        },
-                    ],
-                }
-            ],
-        )
-
-        answer_text = response.output[0].content[0].text.strip()
+        answer_text, tts_url = await vision_answer(question_text, img_bytes)
         print("[음성 Q&A 답변]", answer_text)
 
     except Exception as e:
         print("[ERROR] LLM(voice) 호출 실패:", e)
         return jsonify({"answer": f"LLM 오류: {e}", "error": True})
 
-    # 4) 답변도 TTS로 읽어주기
-    tts_url = None
-    try:
-        filename = f"voice_answer_{int(time.time())}.mp3"
-        save_tts_korean(answer_text, filename)
-        tts_url = f"/tts/{filename}"
-        print("[VOICE Q&A TTS URL]", tts_url)
-    except Exception as e:
-        print("[ERROR] VOICE TTS 실패:", e)
-        tts_url = None
+    # 3) 답변 TTS는 vision_answer에서 스트리밍으로 이미 시작됨
+    print("[VOICE Q&A TTS URL]", tts_url)
 
     return jsonify(
         {
@@ -0,0 +1,218 @@
+"""
+OpenAI 호출 결과 캐시
+
+1) exact 캐시: (model, messages, temperature, tools)의 sha256 키가 같으면 그대로 재사용
+2) semantic 캐시: 입력 문장 임베딩의 코사인 유사도가 임계값 이상이면 재사용
+"""
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Protocol
+import hashlib
+import json
+import threading
+import time
+
+import numpy as np
+
+
+def cache_key(model: str, messages, temperature=None, tools=None) -> str:
+    """요청 내용을 정규화한 JSON의 sha256 hex"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "tools": tools,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[str]:
+        ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        ...
+
+
+class MemoryBackend:
+    """프로세스 메모리 캐시 (TTL + 최대 개수 제한)"""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if expires_at < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+
+class RedisBackend:
+    """여러 워커/서버가 캐시를 공유할 때 사용 (REDIS_URL)"""
+
+    def __init__(self, url: str, prefix: str = "llm_cache:"):
+        import redis.asyncio as redis
+
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(self.prefix + key)
+        return value.decode("utf-8") if value is not None else None
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        await self.client.set(self.prefix + key, value, ex=ttl)
+
+
+class SemanticIndex:
+    """
+    정규화된 임베딩 벡터를 namespace별로 들고 있다가
+    코사인 유사도가 threshold 이상인 가장 가까운 항목을 돌려줌.
+    namespace 수는 LRU로 제한하고, TTL이 지난 항목은 무시/정리.
+    """
+
+    def __init__(
+        self, threshold: float = 0.92, max_size: int = 100, max_namespaces: int = 256
+    ):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.max_namespaces = max_namespaces
+        # namespace -> (vectors (N, D), values list[str], expires_at (N,))
+        self._spaces = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        return v / (np.linalg.norm(v) + 1e-12)
+
+    def lookup(self, namespace: str, vector) -> Optional[str]:
+        with self._lock:
+            space = self._spaces.get(namespace)
+            if space is None:
+                return None
+            self._spaces.move_to_end(namespace)
+            vectors, values, expires_at = space
+            scores = vectors @ self._normalize(vector)
+            scores[expires_at < time.time()] = -np.inf
+            best = int(np.argmax(scores))
+            if scores[best] >= self.threshold:
+                return values[best]
+            return None
+
+    def add(self, namespace: str, vector, value: str, ttl: int) -> None:
+        now = time.time()
+        v = self._normalize(vector)[None, :]
+        with self._lock:
+            if namespace in self._spaces:
+                vectors, values, expires_at = self._spaces[namespace]
+                alive = expires_at >= now
+                vectors = np.vstack([vectors[alive], v])
+                values = [x for x, keep in zip(values, alive) if keep] + [value]
+                expires_at = np.append(expires_at[alive], now + ttl)
+            else:
+                vectors, values, expires_at = v, [value], np.array([now + ttl])
+
+            self._spaces[namespace] = (
+                vectors[-self.max_size :],
+                values[-self.max_size :],
+                expires_at[-self.max_size :],
+            )
+            self._spaces.move_to_end(namespace)
+            while len(self._spaces) > self.max_namespaces:
+                self._spaces.popitem(last=False)
+
+
+class LLMCache:
+    """exact 캐시 + (선택) semantic 캐시를 묶은 캐시"""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: int = 86400,
+        semantic: Optional[SemanticIndex] = None,
+        embed_fn: Optional[Callable[[str], Awaitable[list]]] = None,
+    ):
+        self.backend = backend
+        self.ttl = ttl
+        self.semantic = semantic if embed_fn is not None else None
+        self.embed_fn = embed_fn
+        # get/set에서 같은 문장을 두 번 임베딩하지 않도록 최근 임베딩 보관
+        self._embeddings = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def _embed(self, text: str):
+        with self._lock:
+            if text in self._embeddings:
+                self._embeddings.move_to_end(text)
+                return self._embeddings[text]
+
+        vector = await self.embed_fn(text)
+
+        with self._lock:
+            self._embeddings[text] = vector
+            while len(self._embeddings) > 256:
+                self._embeddings.popitem(last=False)
+        return vector
+
+    async def get(self, key: str) -> Optional[str]:
+        """exact 캐시 조회 (백엔드 오류는 miss로 처리)"""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            print("[ERROR] LLM 캐시 조회 실패 (miss로 처리):", e)
+            return None
+        if value is not None:
+            print("[LLM 캐시] exact hit")
+        return value
+
+    async def get_similar(self, text: str, namespace: str = "") -> Optional[str]:
+        """
+        semantic 캐시 조회 (임베딩 API 호출 포함).
+        hit이면 LLM 호출 비용이 들지 않도록 LLM 요청 전에 부르는 용도.
+        """
+        if self.semantic is None or not text:
+            return None
+
+        try:
+            value = self.semantic.lookup(namespace, await self._embed(text))
+        except Exception as e:
+            print("[ERROR] 임베딩 실패 (semantic 캐시 건너뜀):", e)
+            return None
+        if value is not None:
+            print("[LLM 캐시] semantic hit")
+        return value
+
+    async def set(
+        self, key: str, value: str, text: str = None, namespace: str = ""
+    ) -> None:
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except Exception as e:
+            print("[ERROR] LLM 캐시 저장 실패:", e)
+
+        if self.semantic is None or not text:
+            return
+
+        try:
+            self.semantic.add(namespace, await self._embed(text), value, self.ttl)
+        except Exception as e:
+            print("[ERROR] 임베딩 실패 (semantic 캐시 저장 건너뜀):", e)
@@ -0,0 +1,35 @@
+"""
+BLIP base + LoRA adapter를 한 번만 merge 해서 저장.
+
+    python scripts/merge_lora.py
+
+저장된 blip_lora_ko/merged 가 있으면 app.py는 PEFT merge 없이 바로 로드함.
+"""
+import os
+
+from transformers import BlipForConditionalGeneration
+from peft import PeftModel
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASE_MODEL = "Salesforce/blip-image-captioning-base"
+
+LORA_DIR = os.path.join(BASE_DIR, "blip_lora_ko")
+ADAPTER_DIR = os.path.join(LORA_DIR, "adapter")
+MERGED_DIR = os.path.join(LORA_DIR, "merged")
+
+
+def main():
+    print("🔄 BLIP base 모델 로딩 중...")
+    base_model = BlipForConditionalGeneration.from_pretrained(BASE_MODEL)
+
+    print("🔹 LoRA 어댑터 merge...")
+    lora_model = PeftModel.from_pretrained(base_model, ADAPTER_DIR)
+    model = lora_model.merge_and_unload()
+
+    model.save_pretrained(MERGED_DIR, safe_serialization=True)
+    print(f"✅ 저장 완료: {MERGED_DIR}")
+
+
+if __name__ == "__main__":
+    main()
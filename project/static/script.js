@@ -5,7 +5,7 @@ const video = document.getElementById("video");
 const canvas = document.getElementById("captureCanvas");
 const ctx = canvas.getContext("2d");
 
-let lastImageDataURL = null; // 마지막으로 캡쳐한 프레임 저장
+let lastImageBlob = null; // 마지막으로 캡쳐한 프레임(JPEG Blob) 저장
 
 async function initCamera() {
   try {
@@ -22,7 +22,8 @@ async function initCamera() {
 
 initCamera();
 
-function captureFrameAsDataURL() {
+// base64 dataURL 대신 JPEG Blob 그대로 multipart로 전송 (전송량 ~25% 감소)
+async function captureFrameAsBlob() {
   if (!video.videoWidth || !video.videoHeight) {
     alert("카메라가 아직 준비되지 않았습니다.");
     return null;
@@ -30,9 +31,11 @@ function captureFrameAsDataURL() {
   canvas.width = video.videoWidth;
   canvas.height = video.videoHeight;
   ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-  const dataURL = canvas.toDataURL("image/jpeg");
-  lastImageDataURL = dataURL;
-  return dataURL;
+  const blob = await new Promise((resolve) =>
+    canvas.toBlob(resolve, "image/jpeg")
+  );
+  lastImageBlob = blob;
+  return blob;
 }
 
 function appendLog(prefix, text, type = "me") {
@@ -50,6 +53,16 @@ function appendLog(prefix, text, type = "me") {
   qaLog.scrollTop = qaLog.scrollHeight;
 }
 
+// 스트리밍 TTS 재생: 서버가 첫 mp3 조각을 보내는 즉시 재생이 시작됨
+// (같은 <audio>를 재사용해서 이전 음성은 자동으로 멈춤)
+const ttsAudio = new Audio();
+ttsAudio.preload = "auto";
+
+function playTts(url) {
+  ttsAudio.src = url;
+  return ttsAudio.play();
+}
+
 // =======================
 // 1) 지금 장면 설명 듣기 (/api/caption)
 // =======================
@@ -57,18 +70,20 @@ const captionBtn = document.getElementById("captionBtn");
 const captionTextInner = document.getElementById("captionTextInner");
 
 captionBtn.addEventListener("click", async () => {
-  const imageData = captureFrameAsDataURL();
-  if (!imageData) return;
+  const imageBlob = await captureFrameAsBlob();
+  if (!imageBlob) return;
 
   captionBtn.disabled = true;
   captionBtn.textContent = "분석 중...";
   captionTextInner.textContent = "장면을 분석하는 중입니다...";
 
   try {
+    const formData = new FormData();
+    formData.append("image", imageBlob, "frame.jpg");
+
     const res = await fetch("/api/caption", {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ image: imageData }),
+      body: formData,
     });
 
     const data = await res.json();
@@ -86,8 +101,7 @@ captionBtn.addEventListener("click", async () => {
 
     if (data.tts_url) {
       console.log("caption tts_url:", data.tts_url);
-      const audio = new Audio(data.tts_url);
-      audio.play().catch((e) => {
+      playTts(data.tts_url).catch((e) => {
         console.error("캡션 오디오 자동 재생 실패:", e);
       });
 
@@ -120,8 +134,8 @@ askBtn.addEventListener("click", async () => {
   }
 
   // 아직 캡쳐된 이미지가 없다면 한 번 캡쳐
-  if (!lastImageDataURL) {
-    const img = captureFrameAsDataURL();
+  if (!lastImageBlob) {
+    const img = await captureFrameAsBlob();
     if (!img) return;
   }
 
@@ -130,13 +144,13 @@ askBtn.addEventListener("click", async () => {
   askBtn.disabled = true;
 
   try {
+    const formData = new FormData();
+    formData.append("question", question);
+    formData.append("image", lastImageBlob, "frame.jpg");
+
     const res = await fetch("/api/ask", {
       method: "POST",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({
-        question: question,
-        image: lastImageDataURL,
-      }),
+      body: formData,
     });
 
     const data = await res.json();
@@ -150,8 +164,7 @@ askBtn.addEventListener("click", async () => {
 
     if (data.tts_url) {
       console.log("ask tts_url:", data.tts_url);
-      const audio = new Audio(data.tts_url);
-      audio.play().catch((e) =>
+      playTts(data.tts_url).catch((e) =>
         console.error("텍스트 질문 오디오 실패:", e)
       );
     } else {
@@ -211,14 +224,14 @@ async function startVoiceRecording() {
     const blob = new Blob(audioChunks, { type: "audio/webm" });
 
     // 아직 캡쳐한 이미지가 없다면 한 번 캡쳐
-    if (!lastImageDataURL) {
-      const img = captureFrameAsDataURL();
+    if (!lastImageBlob) {
+      const img = await captureFrameAsBlob();
       if (!img) return;
     }
 
     const formData = new FormData();
     formData.append("audio", blob, "voice.webm");
-    formData.append("image", lastImageDataURL);
+    formData.append("image", lastImageBlob, "frame.jpg");
 
     appendLog("[나 - 음성]", "(질문 전송 중...)", "me");
 
@@ -240,8 +253,7 @@ async function startVoiceRecording() {
 
       if (data.tts_url) {
         console.log("voice tts_url:", data.tts_url);
-        const audio = new Audio(data.tts_url);
-        audio.play().catch((e) =>
+        playTts(data.tts_url).catch((e) =>
           console.error("음성 질문 오디오 실패:", e)
         );
       } else {